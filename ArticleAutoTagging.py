@@ -1,43 +1,53 @@
+import collections
+import mmap
 import os
-from sklearn.feature_extraction.text \
-import CountVectorizer
-import scipy
+import re
+from joblib import Parallel, delayed
 from sklearn.feature_extraction import text
 
-# Step 1 :- Get all the files from folder
-mypath = os.getcwd() + "\\Articles"
-print(mypath)
-for file in os.listdir(mypath):
-    f = open(mypath + "\\" + file,"r")
-    document = []
-    temp = ""
-    # Step 2 :- read the content into document collection
-    for line in f.readlines():
-        temp = temp + line
-
-    document.append(temp)
-
-    # Step 3 :- pass this document to vectorizer
-    vectorizer = CountVectorizer(stop_words=list(text.ENGLISH_STOP_WORDS))
-    # CountVectorizer will take the document content and train himself
-    counts = vectorizer.fit_transform(document)
-    bows = vectorizer.vocabulary_
-    # print(bows)
-    # print(counts)
-    # print(type(bows)) #<class 'dict'>
-    # print(type(counts)) #<class 'scipy.sparse._csr.csr_matrix'>
-    #Create Coo matrix based on counts received in scipy.sparse._csr.csr_matrix
-    coo = scipy.sparse.coo_matrix(counts)
-    #create a file object and open it for writing
-    fileBow = open(f.name + "bow.txt", "w")
-    #For loop to read data count data from coo and string keys from bows e.g. 1 -- Introduction
-    for _count, _bowname in zip(coo.data, bows.keys()):
-            # Check for count which is greater than 2
-            if (_count > 2):
-                # print(str(_count) + " "+ str(_bowname))
-                fileBow.write(str(_count) + " -- " + _bowname + "\n")
-
-    #Close the file which is open for write
-    fileBow.close()
+# sklearn's default token pattern and stop-word list, used directly so the
+# per-article path carries none of the CountVectorizer machinery
+TOKEN_RE = re.compile(r"(?u)\b\w\w+\b")
+STOP = frozenset(text.ENGLISH_STOP_WORDS)
 
 
+def process_article(path):
+    # mmap lets big articles come off the page cache in one pass instead of
+    # being copied chunk by chunk through a Python file object; empty files
+    # cannot be mapped, so they short-circuit to an empty document
+    if os.path.getsize(path) == 0:
+        document = ""
+    else:
+        with open(path, "rb") as f, \
+                mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+            document = mm[:].decode("utf-8", "ignore")
+
+    # Count tokens straight into a Counter -- for per-document counts the
+    # sparse matrix and the vocabulary dict are pure overhead, and the
+    # Counter keys are already the term strings the bow file needs
+    counts = collections.Counter(
+        t for t in TOKEN_RE.findall(document.lower()) if t not in STOP
+    )
+
+    #Collect count and term pairs which are greater than 2 e.g. 3 -- introduction
+    lines = [f"{c} -- {term}" for term, c in counts.items() if c > 2]
+    # one write call per bow file instead of one per term
+    with open(path + "bow.txt", "w", encoding="utf-8") as fileBow:
+        if lines:
+            fileBow.write("\n".join(lines) + "\n")
+
+
+def main():
+    # Step 1 :- Get all the files from folder
+    mypath = os.path.join(os.getcwd(), "Articles")
+    print(mypath)
+    paths = [entry.path for entry in os.scandir(mypath)]
+
+    # Step 2 :- every article is independent, so process them in parallel
+    Parallel(n_jobs=-1, backend="loky")(
+        delayed(process_article)(path) for path in paths
+    )
+
+
+if __name__ == "__main__":
+    main()
@@ -1,14 +1,14 @@
-from sklearn.feature_extraction.text import CountVectorizer
+import collections
+import re
 
-stopwords = []
-stopwords.append("to")
-stopwords.append("and")
-sentence = ["I love to watch movies, especially action movies"]
-#Creating an object of Count Vectorizer. Also stop words as well
-cv = CountVectorizer(stop_words=stopwords)
-#fit, training alogritham - Data - FIT - Train - Model - Transform - Database
-#cv.fit(sentence)
-#cvt = cv.transform(sentence)
-cvt = cv.fit_transform(sentence)
-print(cv.vocabulary_)
-print(cvt)
+# sklearn's default token pattern
+TOKEN_RE = re.compile(r"(?u)\b\w\w+\b")
+
+stopwords = {"to", "and"}
+sentence = "I love to watch movies, especially action movies"
+#Counting words in one sentence does not need a CountVectorizer fit --
+#a Counter over the tokens gives the same bag of words directly
+bow = collections.Counter(
+    t for t in TOKEN_RE.findall(sentence.lower()) if t not in stopwords
+)
+print(bow)
@@ -1,18 +1,13 @@
+import numpy as np
 from sklearn.linear_model import LinearRegression
 
-f = open("Data1.txt","r")
-weight=[]
-nopeople=[]
-for data in f:
-    #we will fill the list and Split the data variable as it contains two values separated in comma
-    _noofpeople,_weight = data.split(",")
-    nopeople.append([int(_noofpeople)])
-    weight.append(float(_weight))
+#np.loadtxt parses the whole comma separated file in C in one call,
+#instead of splitting and converting each line in a Python loop
+data = np.loadtxt("Data1.txt", delimiter=",", dtype=np.float64)
+nopeople = data[:, 0].reshape(-1, 1)
+weight = data[:, 1]
 
 linerobj = LinearRegression()
 #Y=Mx + C
 linerobj=linerobj.fit(nopeople,weight)
 print(linerobj.predict([[3]]))
-
-
-
@@ -19,10 +19,16 @@ print(arr4)
 print(np.mean(arr1))
 
 # Pandas -- Panel Data i.e. Data shows in tabular format
-arrdata= np.array([['Shiv',20], ['Raju',30], ['Hari',75], ['Amar',100]])
+# A structured dtype keeps the ages as a real int32 column; a plain 2D array
+# of mixed values would silently turn everything into strings
+arrdata= np.array([('Shiv',20), ('Raju',30), ('Hari',75), ('Amar',100)],
+                  dtype=[('name','U8'),('age','i4')])
 print(arrdata)
+print(arrdata['age'])
 
-data={'Name':['Shiv','Raju','Hari','Amar'],'Age':[20,30,75,100]}
+# Typed columns so the Age comparison below runs as a vectorized int op
+data={'Name':np.array(['Shiv','Raju','Hari','Amar'], dtype=object),
+      'Age':np.array([20,30,75,100], dtype=np.int32)}
 table1=pd.DataFrame(data)
 print(table1)
 print(table1['Age']>30)
@@ -23,5 +23,7 @@ document=["books are great.",
 vectorizer = TfidfVectorizer()
 tfidfvalues = vectorizer.fit_transform(document)
 print(tfidfvalues)
-print(vectorizer.vocabulary_)
+# index -> term array aligned with the matrix columns above, so feature i
+# can be looked up directly without walking the vocabulary dict
+print(vectorizer.get_feature_names_out())
 
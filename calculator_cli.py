@@ -17,37 +17,20 @@ Notes:
 
 from __future__ import annotations
 
-from dataclasses import dataclass
-from decimal import Decimal, DivisionByZero, InvalidOperation
-import ast
-import re
+from decimal import DivisionByZero, InvalidOperation
 from typing import Optional
 
-
-ALLOWED_EXPR_RE = re.compile(r"^[0-9+\-*/().\s]+$")
-
-
-@dataclass
-class CalculationHistory:
-    last_expression: Optional[str] = None
-    last_result: Optional[str] = None
-
-    def update(self, expression: str, result: str) -> None:
-        self.last_expression = expression
-        self.last_result = result
-
-    def format(self) -> str:
-        if self.last_expression is None:
-            return "No calculations yet."
-        return f"{self.last_expression} = {self.last_result}"
+from calculator_core import CalculationHistory, CalculatorEngine
 
 
 class ExpressionBuffer:
     def __init__(self) -> None:
         self._buffer: list[str] = []
+        self._cached: Optional[str] = ""
 
     def append(self, text: str) -> None:
         self._buffer.append(text)
+        self._cached = None
 
     def backspace(self) -> None:
         if not self._buffer:
@@ -55,71 +38,23 @@ class ExpressionBuffer:
         last = self._buffer.pop()
         if len(last) > 1:
             self._buffer.append(last[:-1])
+        self._cached = None
 
     def clear(self) -> None:
         self._buffer.clear()
+        self._cached = ""
 
     def get(self) -> str:
-        return "".join(self._buffer).strip()
+        # The prompt, is_empty, and evaluate all ask for the buffer on the
+        # same input line; join it once and reuse until the next mutation
+        if self._cached is None:
+            self._cached = "".join(self._buffer).strip()
+        return self._cached
 
     def is_empty(self) -> bool:
         return not self.get()
 
 
-class CalculatorEngine:
-    def evaluate(self, expression: str) -> str:
-        cleaned = expression.strip()
-        if not cleaned:
-            raise ValueError("Expression is empty.")
-        if not ALLOWED_EXPR_RE.match(cleaned):
-            raise ValueError("Expression contains invalid characters.")
-
-        try:
-            tree = ast.parse(cleaned, mode="eval")
-        except SyntaxError as exc:
-            raise ValueError("Malformed expression.") from exc
-
-        result = self._eval_node(tree.body)
-        return self._format_decimal(result)
-
-    def _eval_node(self, node: ast.AST) -> Decimal:
-        if isinstance(node, ast.BinOp):
-            left = self._eval_node(node.left)
-            right = self._eval_node(node.right)
-            return self._apply_binop(node.op, left, right)
-        if isinstance(node, ast.UnaryOp):
-            operand = self._eval_node(node.operand)
-            if isinstance(node.op, ast.UAdd):
-                return operand
-            if isinstance(node.op, ast.USub):
-                return -operand
-        if isinstance(node, ast.Constant) and isinstance(node.value, (int, float)):
-            return Decimal(str(node.value))
-        if isinstance(node, ast.Num):  # For older AST nodes
-            return Decimal(str(node.n))
-        raise ValueError("Unsupported expression element detected.")
-
-    def _apply_binop(self, operator: ast.operator, left: Decimal, right: Decimal) -> Decimal:
-        if isinstance(operator, ast.Add):
-            return left + right
-        if isinstance(operator, ast.Sub):
-            return left - right
-        if isinstance(operator, ast.Mult):
-            return left * right
-        if isinstance(operator, ast.Div):
-            if right == 0:
-                raise DivisionByZero("Division by zero.")
-            return left / right
-        raise ValueError("Unsupported operator detected.")
-
-    def _format_decimal(self, value: Decimal) -> str:
-        normalized = value.normalize()
-        text = format(normalized, "f")
-        if "." in text:
-            text = text.rstrip("0").rstrip(".")
-        return text or "0"
-
-
 class CalculatorCLI:
     def __init__(self) -> None:
         self.buffer = ExpressionBuffer()
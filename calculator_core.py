@@ -0,0 +1,142 @@
+"""Shared expression engine for the CLI and Tkinter calculators."""
+
+from __future__ import annotations
+
+from dataclasses import dataclass
+from decimal import Decimal, DivisionByZero
+import ast
+import functools
+import operator
+import re
+from typing import Callable, Optional, Union
+
+
+ALLOWED_EXPR_RE = re.compile(r"[0-9+\-*/().\s]+")
+
+Number = Union[Decimal, int]
+
+
+@functools.lru_cache(maxsize=256)
+def _parse(expression: str) -> ast.Expression:
+    """Parse an expression, reusing the tree for repeated inputs."""
+    return ast.parse(expression, mode="eval")
+
+
+@functools.lru_cache(maxsize=256)
+def _compile_expr(expression: str) -> Callable[[], Number]:
+    """Compile an expression to a closure, reused for repeated inputs."""
+    # Without "." or "/" every intermediate stays an exact int, so the
+    # expression can run on native ints instead of going through Decimal
+    use_decimal = "." in expression or "/" in expression
+    tree = _parse(expression)
+    evaluator = _compile_node(tree.body, use_decimal)
+    if use_decimal:
+        return evaluator
+    # The walk above already rejected anything but numeric literals and
+    # the four arithmetic operators, so the pure-int case can run as real
+    # CPython bytecode under empty builtins -- one C-level eval call
+    # instead of a chain of closure calls
+    code = compile(tree, "<expr>", "eval")
+    return lambda: eval(code, {"__builtins__": {}}, {})
+
+
+def _compile_node(node: ast.AST, use_decimal: bool) -> Callable[[], Number]:
+    # One dict lookup on the node type replaces the isinstance ladder
+    try:
+        handler = _NODE_TABLE[type(node)]
+    except KeyError:
+        raise ValueError("Unsupported expression element detected.") from None
+    return handler(node, use_decimal)
+
+
+def _compile_binop_node(node: ast.BinOp, use_decimal: bool) -> Callable[[], Number]:
+    left = _compile_node(node.left, use_decimal)
+    right = _compile_node(node.right, use_decimal)
+    if type(node.op) is ast.Div:
+        def divide() -> Decimal:
+            divisor = right()
+            if divisor == 0:
+                raise DivisionByZero("Division by zero.")
+            return left() / divisor
+        return divide
+    try:
+        apply = _BINOP_TABLE[type(node.op)]
+    except KeyError:
+        raise ValueError("Unsupported operator detected.") from None
+    return lambda: apply(left(), right())
+
+
+def _compile_unaryop_node(node: ast.UnaryOp, use_decimal: bool) -> Callable[[], Number]:
+    operand = _compile_node(node.operand, use_decimal)
+    if type(node.op) is ast.UAdd:
+        return operand
+    if type(node.op) is ast.USub:
+        return lambda: -operand()
+    raise ValueError("Unsupported expression element detected.")
+
+
+def _compile_constant_node(node: ast.Constant, use_decimal: bool) -> Callable[[], Number]:
+    if not isinstance(node.value, (int, float)):
+        raise ValueError("Unsupported expression element detected.")
+    value = Decimal(str(node.value)) if use_decimal else node.value
+    return lambda: value
+
+
+def _compile_num_node(node: ast.Num, use_decimal: bool) -> Callable[[], Number]:  # For older AST nodes
+    value = Decimal(str(node.n)) if use_decimal else node.n
+    return lambda: value
+
+
+_BINOP_TABLE = {
+    ast.Add: operator.add,
+    ast.Sub: operator.sub,
+    ast.Mult: operator.mul,
+}
+
+_NODE_TABLE = {
+    ast.BinOp: _compile_binop_node,
+    ast.UnaryOp: _compile_unaryop_node,
+    ast.Constant: _compile_constant_node,
+    ast.Num: _compile_num_node,
+}
+
+
+@dataclass
+class CalculationHistory:
+    last_expression: Optional[str] = None
+    last_result: Optional[str] = None
+
+    def update(self, expression: str, result: str) -> None:
+        self.last_expression = expression
+        self.last_result = result
+
+    def format(self, empty: str = "No calculations yet.") -> str:
+        if self.last_expression is None:
+            return empty
+        return f"{self.last_expression} = {self.last_result}"
+
+
+class CalculatorEngine:
+    def evaluate(self, expression: str) -> str:
+        cleaned = expression.strip()
+        if not cleaned:
+            raise ValueError("Expression is empty.")
+        if not ALLOWED_EXPR_RE.fullmatch(cleaned):
+            raise ValueError("Expression contains invalid characters.")
+
+        try:
+            evaluator = _compile_expr(cleaned)
+        except SyntaxError as exc:
+            raise ValueError("Malformed expression.") from exc
+
+        result = evaluator()
+        if isinstance(result, int):
+            return str(result)
+        return self._format_decimal(result)
+
+    def _format_decimal(self, value: Decimal) -> str:
+        # Integer-valued results skip the normalize/rstrip dance entirely
+        if value == value.to_integral_value():
+            return str(int(value))
+        text = f"{value:f}".rstrip("0").rstrip(".")
+        return text or "0"
@@ -2,85 +2,11 @@
 
 from __future__ import annotations
 
-from dataclasses import dataclass
-from decimal import Decimal, DivisionByZero, InvalidOperation
-import ast
-import re
+from decimal import DivisionByZero, InvalidOperation
 import tkinter as tk
 from tkinter import ttk
-from typing import Optional
 
-
-ALLOWED_EXPR_RE = re.compile(r"^[0-9+\-*/().\s]+$")
-
-
-@dataclass
-class CalculationHistory:
-    last_expression: Optional[str] = None
-    last_result: Optional[str] = None
-
-    def update(self, expression: str, result: str) -> None:
-        self.last_expression = expression
-        self.last_result = result
-
-    def format(self) -> str:
-        if self.last_expression is None:
-            return "History: None"
-        return f"History: {self.last_expression} = {self.last_result}"
-
-
-class CalculatorEngine:
-    def evaluate(self, expression: str) -> str:
-        cleaned = expression.strip()
-        if not cleaned:
-            raise ValueError("Expression is empty.")
-        if not ALLOWED_EXPR_RE.match(cleaned):
-            raise ValueError("Expression contains invalid characters.")
-
-        try:
-            tree = ast.parse(cleaned, mode="eval")
-        except SyntaxError as exc:
-            raise ValueError("Malformed expression.") from exc
-
-        result = self._eval_node(tree.body)
-        return self._format_decimal(result)
-
-    def _eval_node(self, node: ast.AST) -> Decimal:
-        if isinstance(node, ast.BinOp):
-            left = self._eval_node(node.left)
-            right = self._eval_node(node.right)
-            return self._apply_binop(node.op, left, right)
-        if isinstance(node, ast.UnaryOp):
-            operand = self._eval_node(node.operand)
-            if isinstance(node.op, ast.UAdd):
-                return operand
-            if isinstance(node.op, ast.USub):
-                return -operand
-        if isinstance(node, ast.Constant) and isinstance(node.value, (int, float)):
-            return Decimal(str(node.value))
-        if isinstance(node, ast.Num):
-            return Decimal(str(node.n))
-        raise ValueError("Unsupported expression element detected.")
-
-    def _apply_binop(self, operator: ast.operator, left: Decimal, right: Decimal) -> Decimal:
-        if isinstance(operator, ast.Add):
-            return left + right
-        if isinstance(operator, ast.Sub):
-            return left - right
-        if isinstance(operator, ast.Mult):
-            return left * right
-        if isinstance(operator, ast.Div):
-            if right == 0:
-                raise DivisionByZero("Division by zero.")
-            return left / right
-        raise ValueError("Unsupported operator detected.")
-
-    def _format_decimal(self, value: Decimal) -> str:
-        normalized = value.normalize()
-        text = format(normalized, "f")
-        if "." in text:
-            text = text.rstrip("0").rstrip(".")
-        return text or "0"
+from calculator_core import CalculationHistory, CalculatorEngine
 
 
 class CalculatorGUI:
@@ -94,8 +20,9 @@ class CalculatorGUI:
         self.engine = CalculatorEngine()
         self.history = CalculationHistory()
         self.expression = tk.StringVar(value="")
+        self._pending: list[str] = []
         self.result = tk.StringVar(value="0")
-        self.history_text = tk.StringVar(value=self.history.format())
+        self.history_text = tk.StringVar(value=self._format_history())
 
         self._build_ui()
         self._bind_keyboard()
@@ -184,18 +111,33 @@ class CalculatorGUI:
             self.append(char)
 
     def append(self, value: str) -> None:
-        current = self.expression.get()
-        self.expression.set(current + value)
+        # Coalesce bursts of keystrokes into one StringVar update, so Tk
+        # redraws the display once per event-loop pass instead of per key
+        if not self._pending:
+            self.root.after_idle(self._flush_pending)
+        self._pending.append(value)
+
+    def _flush_pending(self) -> None:
+        if not self._pending:
+            return
+        self.expression.set(self.expression.get() + "".join(self._pending))
+        self._pending.clear()
 
     def clear(self) -> None:
+        self._pending.clear()
         self.expression.set("")
         self.result.set("0")
 
     def backspace(self) -> None:
+        self._flush_pending()
         current = self.expression.get()
         self.expression.set(current[:-1])
 
+    def _format_history(self) -> str:
+        return f"History: {self.history.format(empty='None')}"
+
     def evaluate(self) -> None:
+        self._flush_pending()
         expression = self.expression.get()
         try:
             result = self.engine.evaluate(expression)
@@ -208,7 +150,7 @@ class CalculatorGUI:
 
         self.result.set(result)
         self.history.update(expression, result)
-        self.history_text.set(self.history.format())
+        self.history_text.set(self._format_history())
 
 
 def main() -> None: